@@ -0,0 +1,102 @@
+"""
+Admission control for the deployed Flask app.
+Bounds in-flight requests per worker and per session, sheds excess load with
+fast 429/503 responses and keeps a few slots free for cheap /status reads.
+"""
+
+import threading
+from collections import Counter
+from functools import wraps
+from flask import jsonify, request
+from config import (
+    console,
+    MAX_INFLIGHT_PER_WORKER,
+    MAX_INFLIGHT_PER_SESSION,
+    STATUS_RESERVED_SLOTS,
+    ADMISSION_RETRY_AFTER
+)
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_inflight=MAX_INFLIGHT_PER_WORKER,
+        max_per_session=MAX_INFLIGHT_PER_SESSION,
+        reserved_slots=STATUS_RESERVED_SLOTS,
+        retry_after=ADMISSION_RETRY_AFTER
+    ):
+        self.max_inflight = max_inflight
+        self.max_per_session = max_per_session
+        self.reserved_slots = min(reserved_slots, max_inflight - 1)
+        self.retry_after = retry_after
+        self.inflight = 0
+        self.session_inflight = Counter()
+        self.rejected = Counter()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, session_key, expensive, path="request"):
+        """
+        Reserve a slot for a request.
+        Returns None when admitted, otherwise the HTTP status to reject with.
+        """
+        with self._lock:
+            # Expensive requests cannot use the slots reserved for cheap reads
+            limit = self.max_inflight - self.reserved_slots if expensive else self.max_inflight
+            if self.inflight >= limit:
+                rejection = 503
+            elif expensive and self.session_inflight[session_key] >= self.max_per_session:
+                rejection = 429
+            else:
+                rejection = None
+
+            if rejection:
+                self.rejected[rejection] += 1
+                console.print(f"[WARNING] Shedding {path} ({rejection}), {self.inflight} in flight", style="yellow")
+                return rejection
+
+            self.inflight += 1
+            if expensive:
+                self.session_inflight[session_key] += 1
+            return None
+
+    def release(self, session_key, expensive):
+        with self._lock:
+            self.inflight -= 1
+            if expensive:
+                self.session_inflight[session_key] -= 1
+                if self.session_inflight[session_key] <= 0:
+                    del self.session_inflight[session_key]
+
+    def limit(self, expensive=True):
+        """Decorator that admits or sheds a Flask view."""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if request.method == "OPTIONS":
+                    return view(*args, **kwargs)
+
+                session_key = request.headers.get("Session-Id") or request.remote_addr
+                rejection = self.try_acquire(session_key, expensive, request.path)
+                if rejection:
+                    error = "Too many requests for this session" if rejection == 429 else "Server over capacity"
+                    response = jsonify({'error': error})
+                    response.headers['Retry-After'] = str(self.retry_after)
+                    return response, rejection
+
+                try:
+                    return view(*args, **kwargs)
+                finally:
+                    self.release(session_key, expensive)
+            return wrapper
+        return decorator
+
+    def stats(self):
+        with self._lock:
+            return {
+                "inflight": self.inflight,
+                "max_inflight": self.max_inflight,
+                "reserved_slots": self.reserved_slots,
+                "sessions_inflight": len(self.session_inflight),
+                "rejected_429": self.rejected[429],
+                "rejected_503": self.rejected[503],
+            }
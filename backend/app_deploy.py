@@ -1,11 +1,19 @@
 from flask import Flask, render_template, jsonify, request
 from flask_cors import CORS
 import os
-from config import console, GROQ_API_KEY
+import threading
+from config import (
+    console,
+    GROQ_API_KEY,
+    SAMPLE_RATE,
+    SUPPORTED_INPUT_SAMPLE_RATES,
+    MAX_INPUT_CHANNELS
+)
 from llm_handler import LLMHandler
 from websearch_handler import WebSearchHandler
-import numpy as np
 from transcriptions import Transcriber
+from preprocessing import AudioPreprocessingError
+from admission import AdmissionController
 from collections import defaultdict
 import sqlite3
 from datetime import datetime, timedelta
@@ -16,7 +24,7 @@ CORS(app, resources={
         "origins": "*",  # Allow all origins for now
         "methods": ["GET", "POST", "OPTIONS"],
         "allow_headers": ["Content-Type", "Accept", "Authorization", "Origin", "X-Requested-With", "Session-Id"],  # Added "Session-Id"
-        "expose_headers": ["Content-Type", "Authorization"],
+        "expose_headers": ["Content-Type", "Authorization", "Retry-After"],
         "max_age": 3600,
         "supports_credentials": False  # Changed to False since we're using * for origins
     }
@@ -112,17 +120,20 @@ ai_mode_active = False
 websearch_mode_active = False
 latest_transcription = ""
 latest_response = ""
+state_lock = threading.Lock()
 
 # Initialize handlers
 llm_handler = LLMHandler()
 websearch_handler = WebSearchHandler()
 transcriber = Transcriber()
+admission = AdmissionController()
 
 @app.route("/")
 def index():
     return jsonify({"status": "ok"})
 
 @app.route("/status")
+@admission.limit(expensive=False)
 def status():
     session_id = request.headers.get("Session-Id")
     if not session_id:
@@ -141,7 +152,12 @@ def status():
         "response": session[4]
     })
 
+@app.route("/cache/stats")
+def cache_stats():
+    return jsonify(transcriber.cache.stats())
+
 @app.route("/process", methods=["POST"])
+@admission.limit()
 def process():
     session_id = request.headers.get("Session-Id")
     if not session_id:
@@ -197,6 +213,7 @@ def handle_audio_options():
     return response, 200
 
 @app.route('/audio', methods=['POST'])
+@admission.limit()
 def handle_audio():
     if request.method == "OPTIONS":
         return handle_audio_options()
@@ -221,41 +238,38 @@ def handle_audio():
                 'error': 'Invalid audio data format'
             }), 400
 
-        # Convert audio data to numpy array with error handling and detailed logging
-        try:
-            audio_array = np.array(audio_data, dtype=np.float32)
-            console.print(f"[DEBUG] Audio array shape: {audio_array.shape}", style="blue")
-            console.print(f"[DEBUG] Audio array dtype: {audio_array.dtype}", style="blue")
-            console.print(f"[DEBUG] Audio array range: [{audio_array.min()}, {audio_array.max()}]", style="blue")
-            console.print(f"[DEBUG] Non-zero values: {np.count_nonzero(audio_array)}/{audio_array.size}", style="blue")
-        except Exception as e:
-            console.print(f"[ERROR] Failed to convert audio data: {e}", style="bold red")
-            console.print(f"[DEBUG] Raw audio data type: {type(audio_data)}", style="yellow")
-            console.print(f"[DEBUG] Raw audio data length: {len(audio_data)}", style="yellow")
-            console.print(f"[DEBUG] First few values: {audio_data[:10]}", style="yellow")
+        # Clients send their native capture format; the server resamples to SAMPLE_RATE
+        sample_rate = data.get('sampleRate', SAMPLE_RATE)
+        channels = data.get('channels', 1)
+        if (not isinstance(sample_rate, int) or isinstance(sample_rate, bool)
+                or sample_rate not in SUPPORTED_INPUT_SAMPLE_RATES):
+            console.print(f"[ERROR] Unsupported sample rate: {sample_rate}", style="bold red")
             return jsonify({
-                'error': 'Failed to process audio data'
+                'error': 'Unsupported sample rate',
+                'supported': list(SUPPORTED_INPUT_SAMPLE_RATES)
             }), 400
-
-        # Check audio array validity
-        if audio_array.size == 0:
-            console.print("[ERROR] Empty audio data", style="bold red")
+        if (not isinstance(channels, int) or isinstance(channels, bool)
+                or not 1 <= channels <= MAX_INPUT_CHANNELS):
+            console.print(f"[ERROR] Unsupported channel count: {channels}", style="bold red")
             return jsonify({
-                'error': 'Empty audio data'
+                'error': 'Unsupported channel count',
+                'supported': list(range(1, MAX_INPUT_CHANNELS + 1))
             }), 400
-            
-        # Check if audio data contains actual signal
-        if np.allclose(audio_array, 0):
-            console.print("[WARNING] Audio data contains only zeros", style="yellow")
+
+        console.print(f"[INFO] Processing audio data of length {len(audio_data)} ({sample_rate} Hz, {channels} ch)", style="bold green")
+
+        # Decode, resample, normalize and encode the audio (off-thread when a pool is configured)
+        try:
+            wav_bytes, digest = transcriber.prepare(audio_data, sample_rate, channels)
+        except AudioPreprocessingError as e:
+            console.print(f"[ERROR] {e}", style="bold red")
             return jsonify({
-                'error': 'Silent audio data'
+                'error': str(e)
             }), 400
 
-        console.print(f"[INFO] Processing audio data of length {len(audio_data)}", style="bold green")
-        
         # Process the audio (transcribe)
         try:
-            transcription = transcriber.transcribe(audio_array)
+            transcription = transcriber.transcribe_wav(wav_bytes, digest)
             if not transcription:
                 console.print("[ERROR] Transcription failed", style="bold red")
                 return jsonify({
@@ -268,12 +282,12 @@ def handle_audio():
                 'details': str(e)
             }), 500
 
-        # Update global state
+        # Update global state; /audio runs on parallel threads (see gunicorn.conf.py), so
+        # mode changes and writes go through state_lock
         global ai_mode_active, websearch_mode_active, latest_transcription, latest_response
-        latest_transcription = transcription
-        
-        # Process the transcription based on mode
-        try:
+        with state_lock:
+            latest_transcription = transcription
+            action = None
             if "ai mode" in transcription.lower():
                 ai_mode_active = True
                 websearch_mode_active = False
@@ -283,13 +297,17 @@ def handle_audio():
                 websearch_mode_active = True
                 latest_response = "Web search mode activated"
             elif websearch_mode_active and transcription.strip().endswith("?"):
-                response = websearch_handler.search(transcription)
-                if response:
-                    latest_response = response
+                action = "search"
             elif ai_mode_active:
-                response = llm_handler.get_response(transcription)
-                if response:
-                    latest_response = response
+                action = "llm"
+
+        # Process the transcription based on mode; slow lookups run outside the lock
+        try:
+            response = None
+            if action == "search":
+                response = websearch_handler.search(transcription)
+            elif action == "llm":
+                response = llm_handler.get_response(transcription, request.headers.get("Session-Id"))
         except Exception as e:
             console.print(f"[ERROR] Response processing failed: {e}", style="bold red")
             return jsonify({
@@ -297,12 +315,18 @@ def handle_audio():
                 'details': str(e)
             }), 500
 
+        with state_lock:
+            if response:
+                latest_response = response
+            reply = latest_response
+            mode = "WebSearch" if websearch_mode_active else "AI"
+
         console.print("[SUCCESS] Audio processed successfully", style="bold green")
         return jsonify({
             'success': True,
             'transcription': transcription,
-            'response': latest_response,
-            'mode': "WebSearch" if websearch_mode_active else "AI"
+            'response': reply,
+            'mode': mode
         })
 
     except Exception as e:
@@ -0,0 +1,71 @@
+"""
+Throughput benchmark for the audio preprocessing executor.
+Simulates concurrent /audio requests (one thread each, as in a threaded gunicorn
+worker) and reports chunks/second for inline preprocessing and for pools of
+increasing size.
+
+    cd backend && python -m benchmarks.bench_preprocessing --requests 200 --sample-rate 48000
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import console, CHUNK_DURATION, OVERLAP_DURATION, SUPPORTED_INPUT_SAMPLE_RATES  # noqa: E402
+from preprocessing import AudioPreprocessor  # noqa: E402
+
+
+def make_chunk(seed, sample_rate):
+    rng = np.random.default_rng(seed)
+    samples = (CHUNK_DURATION + OVERLAP_DURATION) * sample_rate
+    # Lists, like the JSON body Flask hands to the /audio handler
+    return (rng.standard_normal(samples, dtype=np.float32) * 0.3).tolist()
+
+
+def run(workers, chunks, sample_rate, concurrency):
+    preprocessor = AudioPreprocessor(workers=workers)
+    process = lambda chunk: preprocessor.process(chunk, sample_rate)  # noqa: E731
+    try:
+        # Warm up the pool (process start-up, filter design) so it is not measured
+        for chunk in chunks[:max(workers, 1)]:
+            process(chunk)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(process, chunks))
+        elapsed = time.perf_counter() - start
+    finally:
+        preprocessor.shutdown()
+    return len(chunks) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--sample-rate", type=int, default=48000, choices=SUPPORTED_INPUT_SAMPLE_RATES, help="client capture rate to resample from")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    chunks = [make_chunk(i, args.sample_rate) for i in range(args.requests)]
+    worker_counts = [0] + [n for n in (1, 2, 4, 8, 16, 32) if n <= args.max_workers]
+    if args.max_workers not in worker_counts:
+        worker_counts.append(args.max_workers)
+
+    baseline = None
+    console.print(f"{'workers':>8} {'chunks/s':>10} {'speedup':>8}", style="bold")
+    for workers in worker_counts:
+        throughput = run(workers, chunks, args.sample_rate, args.concurrency)
+        baseline = baseline or throughput
+        label = "inline" if workers == 0 else str(workers)
+        console.print(f"{label:>8} {throughput:>10.1f} {throughput / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
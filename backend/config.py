@@ -28,6 +28,33 @@ SAMPLE_RATE = 16000  # Hz
 CHUNK_DURATION = 4   # seconds
 OVERLAP_DURATION = 2 # seconds
 
+# Accepted client formats; uploads are downmixed and resampled to SAMPLE_RATE.
+# Only standard rates are allowed: the resampling filter grows with the
+# rate ratio, so arbitrary client rates could force huge filter designs.
+SUPPORTED_INPUT_SAMPLE_RATES = (8000, 11025, 16000, 22050, 24000, 32000, 44100, 48000, 88200, 96000, 192000)  # Hz
+MAX_INPUT_CHANNELS = 8
+
 # Derived Audio Parameters
 CHUNK_SAMPLES = SAMPLE_RATE * CHUNK_DURATION
-OVERLAP_SAMPLES = SAMPLE_RATE * OVERLAP_DURATION
\ No newline at end of file
+OVERLAP_SAMPLES = SAMPLE_RATE * OVERLAP_DURATION
+
+# Preprocessing Executor
+# ----------------------
+# Number of worker processes used for decode/resample/normalize/encode of uploaded
+# audio. 0 keeps preprocessing on the request thread.
+PREPROCESS_WORKERS = int(os.environ.get("PREPROCESS_WORKERS", 0))
+
+# Transcription Cache
+# -------------------
+# Identical audio chunks (retried uploads, shared microphones) reuse the stored
+# transcription. Size 0 disables the cache; set a path to persist it in SQLite.
+TRANSCRIPTION_CACHE_SIZE = int(os.environ.get("TRANSCRIPTION_CACHE_SIZE", 1024))  # entries
+TRANSCRIPTION_CACHE_PATH = os.environ.get("TRANSCRIPTION_CACHE_PATH")
+
+# Admission Control
+# -----------------
+# Per gunicorn worker; gunicorn.conf.py sizes the worker thread pool to match.
+MAX_INFLIGHT_PER_WORKER = int(os.environ.get("MAX_INFLIGHT_PER_WORKER", 8))
+MAX_INFLIGHT_PER_SESSION = int(os.environ.get("MAX_INFLIGHT_PER_SESSION", 2))
+STATUS_RESERVED_SLOTS = int(os.environ.get("STATUS_RESERVED_SLOTS", 2))  # slots only cheap reads may use
+ADMISSION_RETRY_AFTER = int(os.environ.get("ADMISSION_RETRY_AFTER", 1))  # seconds
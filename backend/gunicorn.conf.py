@@ -0,0 +1,14 @@
+"""
+Gunicorn settings for the deployed app.
+Threads per worker follow MAX_INFLIGHT_PER_WORKER so admission control, not
+gunicorn's request queue, decides which requests wait.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import MAX_INFLIGHT_PER_WORKER  # noqa: E402
+
+threads = MAX_INFLIGHT_PER_WORKER
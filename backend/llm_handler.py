@@ -1,18 +1,28 @@
+import threading
+from collections import defaultdict
 from groq import Groq
 from config import GROQ_API_KEY, GROQ_MODEL_NAME, console
 
+# Only the last two prompts and the last reply are sent; keep a little slack
+MAX_HISTORY_MESSAGES = 8
+
 class LLMHandler:
     def __init__(self):
         self.client = Groq(api_key=GROQ_API_KEY)
-        self.message_history = []
+        # Conversation history per session; threaded gunicorn workers share this handler
+        self.message_history = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def get_response(self, prompt, session_id=None):
+        with self._lock:
+            history = self.message_history[session_id]
+            history.append({"role": "user", "content": prompt})
+            del history[:-MAX_HISTORY_MESSAGES]
+            trimmed = [m for m in history if m["role"] == "user"][-2:]
+            assistant = [m for m in history if m["role"] == "assistant"]
+            if assistant:
+                trimmed.insert(1, assistant[-1])
 
-    def get_response(self, prompt):
-        self.message_history.append({"role": "user", "content": prompt})
-        trimmed = [m for m in self.message_history if m["role"] == "user"][-2:]
-        assistant = [m for m in self.message_history if m["role"] == "assistant"]
-        if assistant:
-            trimmed.insert(1, assistant[-1])
-        
         try:
             completion = self.client.chat.completions.create(
                 model=GROQ_MODEL_NAME,
@@ -20,8 +30,9 @@ class LLMHandler:
                 max_tokens=512
             )
             reply = completion.choices[0].message.content.strip()
-            self.message_history.append({"role": "assistant", "content": reply})
+            with self._lock:
+                self.message_history[session_id].append({"role": "assistant", "content": reply})
             return reply
         except Exception as e:
             console.print(f"[ERROR] Groq API request failed: {e}", style="bold red")
-            return None
\ No newline at end of file
+            return None
@@ -0,0 +1,156 @@
+"""
+CPU-bound audio preprocessing for the transcription pipeline.
+Runs decode, downmix/resample, normalize and WAV encoding either inline or in a process pool,
+handing samples to the workers through shared memory instead of pickling them.
+"""
+
+import hashlib
+import io
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+import soundfile as sf
+from config import console, SAMPLE_RATE, SUPPORTED_INPUT_SAMPLE_RATES, PREPROCESS_WORKERS
+from resampling import downmix, resample
+
+
+class AudioPreprocessingError(ValueError):
+    """Raised when uploaded audio cannot be turned into a transcribable chunk."""
+
+
+def preprocess_audio(audio_data, sample_rate=SAMPLE_RATE, channels=1):
+    """
+    Downmix and resample an interleaved float32 buffer to mono SAMPLE_RATE,
+    then normalize it and encode it as 16-bit WAV bytes.
+    Returns the encoded bytes and a dict of statistics for logging, including
+    a content digest of the normalized PCM for cache lookups.
+    """
+    if audio_data.size == 0:
+        raise AudioPreprocessingError("Empty audio data")
+    if audio_data.size % channels:
+        raise AudioPreprocessingError("Audio length is not a multiple of the channel count")
+    if sample_rate not in SUPPORTED_INPUT_SAMPLE_RATES:
+        raise AudioPreprocessingError("Unsupported sample rate")
+
+    input_samples = int(audio_data.size)
+    audio_data = resample(downmix(audio_data, channels), sample_rate, SAMPLE_RATE)
+
+    stats = {
+        "input_rate": sample_rate,
+        "input_channels": channels,
+        "input_samples": input_samples,
+        "samples": int(audio_data.size),
+        "min": float(audio_data.min()),
+        "max": float(audio_data.max()),
+        "nonzero": int(np.count_nonzero(audio_data)),
+        "clipped": False,
+    }
+
+    if np.allclose(audio_data, 0):
+        raise AudioPreprocessingError("Silent audio data")
+
+    # Normalize audio if needed
+    if stats["max"] > 1.0 or stats["min"] < -1.0:
+        audio_data = np.clip(audio_data, -1.0, 1.0)
+        stats["clipped"] = True
+
+    buffer = io.BytesIO()
+    sf.write(buffer, audio_data, samplerate=SAMPLE_RATE, format="WAV", subtype="PCM_16")
+    wav_bytes = buffer.getvalue()
+    stats["digest"] = hashlib.blake2b(wav_bytes, digest_size=16).hexdigest()
+    return wav_bytes, stats
+
+
+def _to_samples(audio_data):
+    """
+    Convert a flat list or an array of samples to a 1-D float32 array.
+    Arrays are flattened; nested lists are rejected.
+    """
+    try:
+        audio_array = np.asarray(audio_data, dtype=np.float32)
+    except (TypeError, ValueError) as e:
+        console.print(f"[ERROR] Failed to convert audio data: {e}", style="bold red")
+        raise AudioPreprocessingError("Failed to process audio data") from e
+    if not isinstance(audio_data, np.ndarray) and audio_array.ndim != 1:
+        console.print(f"[ERROR] Audio data must be a flat list, got shape {audio_array.shape}", style="bold red")
+        raise AudioPreprocessingError("Failed to process audio data")
+    return audio_array.ravel()
+
+
+def _preprocess_shared(name, count, sample_rate, channels):
+    """Pool entry point: attach to the parent's shared block and preprocess it in place."""
+    # Workers share the parent's resource tracker, so attaching does not add a
+    # second registration; the parent unlinks the block once the result is back.
+    shm = shared_memory.SharedMemory(name=name)
+    audio_data = np.ndarray((count,), dtype=np.float32, buffer=shm.buf)
+    try:
+        return preprocess_audio(audio_data, sample_rate, channels)
+    finally:
+        del audio_data
+        try:
+            shm.close()
+        except BufferError:
+            # A traceback still references the view; the mapping goes with it.
+            pass
+
+
+class AudioPreprocessor:
+    def __init__(self, workers=PREPROCESS_WORKERS):
+        self.workers = workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        # Created lazily so each gunicorn worker starts its own pool after forking.
+        with self._lock:
+            if self._executor is None:
+                console.print(f"[INFO] Starting preprocessing pool with {self.workers} workers", style="bold green")
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def process(self, audio_data, sample_rate=SAMPLE_RATE, channels=1):
+        """
+        Preprocess a list or array of interleaved float samples.
+        Returns (wav_bytes, stats); raises AudioPreprocessingError on unusable input.
+        """
+        # Both paths convert the same way, so the pool never changes which inputs are valid
+        audio_array = _to_samples(audio_data)
+        if not self.workers:
+            return preprocess_audio(audio_array, sample_rate, channels)
+
+        count = audio_array.size
+        if count == 0:
+            raise AudioPreprocessingError("Empty audio data")
+
+        shm = shared_memory.SharedMemory(create=True, size=audio_array.nbytes)
+        try:
+            # Hand the samples over through shared memory instead of pickling them
+            shared = np.ndarray((count,), dtype=np.float32, buffer=shm.buf)
+            shared[:] = audio_array
+            del shared
+
+            executor = self._get_executor()
+            try:
+                return executor.submit(_preprocess_shared, shm.name, count, sample_rate, channels).result()
+            except BrokenProcessPool:
+                # A worker died; drop the pool so the next request starts a fresh one.
+                with self._lock:
+                    if self._executor is executor:
+                        self._executor = None
+                raise
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
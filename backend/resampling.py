@@ -0,0 +1,73 @@
+"""
+Vectorized downmixing and polyphase resampling for uploaded audio.
+Lets clients send buffers at their native rate and channel count; the server
+converts them to the mono SAMPLE_RATE signal Whisper expects.
+"""
+
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+# Filter design parameters
+HALF_WIDTH = 10      # zero crossings of the sinc on each side
+ROLLOFF = 0.95       # cutoff as a fraction of the output Nyquist
+KAISER_BETA = 5.0
+BLOCK_SIZE = 8192    # output samples computed per vectorized block
+
+
+@lru_cache(maxsize=32)
+def design_filter(up, down):
+    """
+    Design the anti-aliasing low-pass filter for an up/down rational resampler
+    and split it into its polyphase bank of shape (up, taps_per_phase).
+    Cached per rate pair, so each worker designs a filter only once.
+    """
+    factor = max(up, down)
+    num_taps = 2 * HALF_WIDTH * factor + 1
+    cutoff = ROLLOFF / factor
+    t = np.arange(num_taps) - (num_taps - 1) / 2
+    taps = cutoff * np.sinc(cutoff * t) * np.kaiser(num_taps, KAISER_BETA)
+    # Zero-stuffing by `up` scales DC by 1/up; normalize for unity passband gain
+    taps *= up / taps.sum()
+
+    taps = np.concatenate([taps, np.zeros(-num_taps % up)])
+    bank = taps.reshape(-1, up).T.astype(np.float32)
+    bank.setflags(write=False)
+    return bank, (num_taps - 1) // 2
+
+
+def downmix(audio_data, channels):
+    """Average interleaved multi-channel samples down to mono."""
+    if channels == 1:
+        return audio_data
+    return audio_data.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+
+
+def resample(audio_data, orig_rate, target_rate):
+    """Resample a mono float32 signal from orig_rate to target_rate."""
+    if orig_rate == target_rate:
+        return audio_data
+
+    divisor = gcd(orig_rate, target_rate)
+    up, down = target_rate // divisor, orig_rate // divisor
+    bank, delay = design_filter(up, down)
+    taps_per_phase = bank.shape[1]
+
+    num_out = -(-audio_data.size * up // down)
+    # Zero padding on both sides so every tap reads a valid index
+    padded = np.concatenate([
+        np.zeros(taps_per_phase, dtype=np.float32),
+        audio_data.astype(np.float32, copy=False),
+        np.zeros(taps_per_phase, dtype=np.float32),
+    ])
+    offsets = taps_per_phase - np.arange(taps_per_phase)
+
+    output = np.empty(num_out, dtype=np.float32)
+    for start in range(0, num_out, BLOCK_SIZE):
+        # Position of each output sample on the upsampled grid
+        t = np.arange(start, min(start + BLOCK_SIZE, num_out)) * down + delay
+        phase, base = np.divmod(t, up)[::-1]
+        frames = padded[base[:, None] + offsets[None, :]]
+        output[start:start + t.size] = np.einsum("ij,ij->i", frames, bank[phase])
+    return output
@@ -0,0 +1,64 @@
+from math import gcd
+
+import numpy as np
+import pytest
+
+from config import SAMPLE_RATE, SUPPORTED_INPUT_SAMPLE_RATES
+from preprocessing import AudioPreprocessingError, preprocess_audio
+from resampling import design_filter, downmix, resample
+
+
+def reference_resample(audio_data, up, down):
+    """Zero-stuff, convolve with the full filter, then decimate."""
+    bank, delay = design_filter(up, down)
+    taps = bank.T.ravel().astype(np.float64)
+    stuffed = np.zeros(audio_data.size * up)
+    stuffed[::up] = audio_data
+    filtered = np.convolve(stuffed, taps)
+    num_out = -(-audio_data.size * up // down)
+    return filtered[np.arange(num_out) * down + delay]
+
+
+@pytest.mark.parametrize("orig_rate", [8000, 11025, 22050, 44100, 48000])
+def test_resample_matches_direct_reference(orig_rate):
+    rng = np.random.default_rng(orig_rate)
+    audio_data = rng.uniform(-0.5, 0.5, orig_rate // 10).astype(np.float32)
+    divisor = gcd(orig_rate, SAMPLE_RATE)
+    up, down = SAMPLE_RATE // divisor, orig_rate // divisor
+
+    result = resample(audio_data, orig_rate, SAMPLE_RATE)
+    expected = reference_resample(audio_data.astype(np.float64), up, down)
+
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, atol=1e-5)
+
+
+def test_resample_attenuates_content_above_target_nyquist():
+    t = np.arange(48000) / 48000
+    tone = (0.5 * np.sin(2 * np.pi * 12000 * t)).astype(np.float32)
+    result = resample(tone, 48000, SAMPLE_RATE)
+    assert np.sqrt(np.mean(result[500:-500] ** 2)) < 1e-3
+
+
+def test_resample_same_rate_is_passthrough():
+    audio_data = np.ones(10, dtype=np.float32)
+    assert resample(audio_data, SAMPLE_RATE, SAMPLE_RATE) is audio_data
+
+
+def test_downmix_averages_interleaved_channels():
+    stereo = np.array([1.0, 0.0, 0.5, 0.5], dtype=np.float32)
+    np.testing.assert_allclose(downmix(stereo, 2), [0.5, 0.5])
+
+
+@pytest.mark.parametrize("orig_rate", SUPPORTED_INPUT_SAMPLE_RATES)
+def test_supported_rates_have_small_filters(orig_rate):
+    divisor = gcd(orig_rate, SAMPLE_RATE)
+    bank, _ = design_filter(SAMPLE_RATE // divisor, orig_rate // divisor)
+    assert bank.size < 20000
+
+
+def test_unsupported_rate_is_rejected_before_filter_design():
+    design_filter.cache_clear()
+    with pytest.raises(AudioPreprocessingError):
+        preprocess_audio(np.full(100, 0.1, dtype=np.float32), sample_rate=191999)
+    assert design_filter.cache_info().currsize == 0
@@ -0,0 +1,65 @@
+import sqlite3
+
+from transcription_cache import TranscriptionCache
+
+
+def persisted_digests(path):
+    conn = sqlite3.connect(path)
+    digests = {row[0] for row in conn.execute("SELECT digest FROM transcription_cache")}
+    conn.close()
+    return digests
+
+
+def test_evicts_least_recently_used_entry():
+    cache = TranscriptionCache(max_entries=2, path=None)
+    cache.put("a", "first")
+    cache.put("b", "second")
+    assert cache.get("a") == "first"
+
+    cache.put("c", "third")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "first"
+    assert cache.get("c") == "third"
+
+
+def test_newest_row_survives_same_second_writes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = TranscriptionCache(max_entries=2, path=path)
+    cache.put("a", "first")
+    cache.put("b", "second")
+    cache.put("c", "third")
+
+    assert persisted_digests(path) == {"b", "c"}
+
+
+def test_lru_order_survives_reopen(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = TranscriptionCache(max_entries=2, path=path)
+    cache.put("a", "first")
+    cache.put("b", "second")
+    # Memory hit on the older entry must reach the persisted order
+    assert cache.get("a") == "first"
+    cache.put("c", "third")
+
+    assert persisted_digests(path) == {"a", "c"}
+
+    reopened = TranscriptionCache(max_entries=2, path=path)
+    assert reopened.get("b") is None
+    assert reopened.get("c") == "third"
+    assert reopened.get("a") == "first"
+    reopened.put("d", "fourth")
+    assert persisted_digests(path) == {"a", "d"}
+
+
+def test_stats_report_hit_rate_and_bytes_saved():
+    cache = TranscriptionCache(max_entries=4, path=None)
+    cache.get("a", 100)
+    cache.put("a", "text")
+    cache.get("a", 100)
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["bytes_saved"] == 100
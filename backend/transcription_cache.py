@@ -0,0 +1,161 @@
+"""
+Content-addressed cache for Whisper transcriptions.
+Entries are keyed by the digest of the normalized PCM so identical uploads skip
+the API call. Bounded by entry count with LRU eviction and optionally persisted
+to SQLite so gunicorn workers and restarts share results.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from config import console, TRANSCRIPTION_CACHE_SIZE, TRANSCRIPTION_CACHE_PATH
+
+
+class TranscriptionCache:
+    def __init__(self, max_entries=TRANSCRIPTION_CACHE_SIZE, path=TRANSCRIPTION_CACHE_PATH):
+        self.max_entries = max_entries
+        self.path = path
+        self._entries = OrderedDict()
+        # last_used updates for memory hits, written with the next SQLite access
+        self._pending_touches = {}
+        self._last_stamp = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        if self.path:
+            self._init_db()
+
+    def _connect(self):
+        return sqlite3.connect(self.path)
+
+    def _init_db(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS transcription_cache (
+                digest TEXT PRIMARY KEY,
+                transcription TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+    def _next_stamp(self):
+        # Caller holds the lock. Epoch seconds, strictly increasing within this
+        # process so back-to-back writes never tie (SQLite's clock is only ms).
+        self._last_stamp = max(time.time(), self._last_stamp + 1e-6)
+        return self._last_stamp
+
+    def _load(self, digest):
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            self._flush_touches(cursor)
+            cursor.execute("SELECT transcription FROM transcription_cache WHERE digest = ?", (digest,))
+            row = cursor.fetchone()
+            if row:
+                with self._lock:
+                    stamp = self._next_stamp()
+                cursor.execute("UPDATE transcription_cache SET last_used = ? WHERE digest = ?", (stamp, digest))
+            conn.commit()
+            conn.close()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            console.print(f"[ERROR] Transcription cache read failed: {e}", style="bold red")
+            return None
+
+    def _flush_touches(self, cursor):
+        # Batch the hit times recorded in memory so hits never wait on SQLite
+        with self._lock:
+            pending, self._pending_touches = self._pending_touches, {}
+        if pending:
+            cursor.executemany(
+                "UPDATE transcription_cache SET last_used = MAX(last_used, ?) WHERE digest = ?",
+                [(used, digest) for digest, used in pending.items()]
+            )
+
+    def _store(self, digest, transcription):
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            self._flush_touches(cursor)
+            with self._lock:
+                stamp = self._next_stamp()
+            cursor.execute("""
+                INSERT INTO transcription_cache (digest, transcription, last_used)
+                VALUES (?, ?, ?)
+                ON CONFLICT(digest) DO UPDATE SET
+                    transcription = excluded.transcription,
+                    last_used = excluded.last_used
+            """, (digest, transcription, stamp))
+            # Ties on last_used fall back to rowid so the newest row is never the one evicted
+            cursor.execute("""
+                DELETE FROM transcription_cache WHERE digest NOT IN (
+                    SELECT digest FROM transcription_cache ORDER BY last_used DESC, rowid DESC LIMIT ?
+                )
+            """, (self.max_entries,))
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            console.print(f"[ERROR] Transcription cache write failed: {e}", style="bold red")
+
+    def _remember(self, digest, transcription):
+        # Caller holds the lock
+        self._entries[digest] = transcription
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, digest, audio_bytes=0):
+        """Return the cached transcription for digest, or None on a miss."""
+        if not self.max_entries:
+            return None
+
+        with self._lock:
+            transcription = self._entries.get(digest)
+            if transcription is not None:
+                self._entries.move_to_end(digest)
+                if self.path:
+                    self._pending_touches[digest] = self._next_stamp()
+
+        if transcription is None and self.path:
+            transcription = self._load(digest)
+
+        with self._lock:
+            if transcription is None:
+                self.misses += 1
+                return None
+            self._remember(digest, transcription)
+            self.hits += 1
+            self.bytes_saved += audio_bytes
+        return transcription
+
+    def record_hit(self, audio_bytes=0):
+        """Count a request answered from another caller's in-flight result."""
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += audio_bytes
+
+    def put(self, digest, transcription):
+        if not self.max_entries or not transcription:
+            return
+        with self._lock:
+            self._remember(digest, transcription)
+        if self.path:
+            self._store(digest, transcription)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "persistent": bool(self.path),
+            }
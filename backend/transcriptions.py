@@ -1,53 +1,98 @@
+import threading
+from concurrent.futures import Future
 from groq import Groq
-import numpy as np
-import soundfile as sf
-import os
-from config import console, GROQ_API_KEY, GROQ_WHISPER_MODEL
+from config import console, GROQ_API_KEY, GROQ_WHISPER_MODEL, SAMPLE_RATE
+from preprocessing import AudioPreprocessor
+from transcription_cache import TranscriptionCache
 
 class Transcriber:
-    def __init__(self):
+    def __init__(self, preprocessor=None, cache=None):
         self.client = Groq(api_key=GROQ_API_KEY)
+        self.preprocessor = preprocessor or AudioPreprocessor()
+        self.cache = cache or TranscriptionCache()
+        # Whisper calls in progress, by digest, so concurrent duplicates share one
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
 
-    def transcribe(self, audio_data):
+    def prepare(self, audio_data, sample_rate=SAMPLE_RATE, channels=1):
         """
-        Transcribe audio data using Groq's Whisper API
+        Decode, downmix/resample, normalize and encode audio data as WAV bytes.
+        Returns (wav_bytes, digest); raises AudioPreprocessingError if the audio is unusable.
+        """
+        wav_bytes, stats = self.preprocessor.process(audio_data, sample_rate, channels)
+
+        # Debug logging
+        console.print(f"[DEBUG] Input audio samples: {stats['input_samples']} ({stats['input_rate']} Hz, {stats['input_channels']} channel(s))", style="blue")
+        console.print(f"[DEBUG] Resampled audio samples: {stats['samples']} ({SAMPLE_RATE} Hz mono)", style="blue")
+        console.print(f"[DEBUG] Audio range: [{stats['min']:.3f}, {stats['max']:.3f}]", style="blue")
+        console.print(f"[DEBUG] Non-zero values: {stats['nonzero']}/{stats['samples']}", style="blue")
+        if stats["clipped"]:
+            console.print("[DEBUG] Audio data clipped to [-1, 1]", style="blue")
+        console.print(f"[DEBUG] Encoded WAV size: {len(wav_bytes)} bytes", style="blue")
+        return wav_bytes, stats["digest"]
+
+    def transcribe_wav(self, wav_bytes, digest):
+        """
+        Transcribe encoded WAV bytes using Groq's Whisper API,
+        reusing the cached or in-flight result for identical audio
         """
+        # Register before checking the cache: the first caller puts its result in
+        # the cache before leaving _inflight, so a duplicate always sees one of them
+        with self._inflight_lock:
+            pending = self._inflight.get(digest)
+            if pending is None:
+                pending = self._inflight[digest] = Future()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            console.print("[INFO] Waiting for identical in-flight transcription", style="blue")
+            transcription = pending.result()
+            if transcription is not None:
+                self.cache.record_hit(len(wav_bytes))
+            return transcription
+
+        transcription = None
         try:
-            # Debug logging
-            console.print(f"[DEBUG] Input audio data shape: {audio_data.shape}", style="blue")
-            console.print(f"[DEBUG] Input audio data type: {audio_data.dtype}", style="blue")
-            console.print(f"[DEBUG] Audio range: [{audio_data.min():.3f}, {audio_data.max():.3f}]", style="blue")
-            
-            # Normalize audio if needed
-            if audio_data.max() > 1.0 or audio_data.min() < -1.0:
-                audio_data = np.clip(audio_data, -1.0, 1.0)
-                console.print("[DEBUG] Audio data clipped to [-1, 1]", style="blue")
-            
-            # Convert numpy array to temporary file
-            temp_file = "temp_audio.wav"
-            sf.write(temp_file, audio_data, samplerate=16000)
-            
-            # Verify the written file
-            file_info = sf.info(temp_file)
-            console.print(f"[DEBUG] WAV file info: {file_info}", style="blue")
-            
-            with open(temp_file, "rb") as file:
-                transcription = self.client.audio.transcriptions.create(
-                    file=(temp_file, file.read()),
-                    model=GROQ_WHISPER_MODEL,
-                    response_format="verbose_json"
-                )
-            
-            # Clean up temp file
-            os.remove(temp_file)
+            transcription = self.cache.get(digest, len(wav_bytes))
+            if transcription is not None:
+                console.print(f"[SUCCESS] Transcription cache hit: {transcription}", style="green")
+            else:
+                transcription = self._request_transcription(wav_bytes, digest)
+            return transcription
+        finally:
+            with self._inflight_lock:
+                del self._inflight[digest]
+            pending.set_result(transcription)
+
+    def _request_transcription(self, wav_bytes, digest):
+        try:
+            transcription = self.client.audio.transcriptions.create(
+                file=("audio.wav", wav_bytes),
+                model=GROQ_WHISPER_MODEL,
+                response_format="verbose_json"
+            )
             
             if not transcription or not transcription.text:
                 console.print("[WARNING] No transcription generated", style="yellow")
                 return None
                 
             console.print(f"[SUCCESS] Transcribed: {transcription.text}", style="green")
+            self.cache.put(digest, transcription.text)
             return transcription.text
             
         except Exception as e:
             console.print(f"[ERROR] Transcription failed: {e}", style="bold red")
-            return None
\ No newline at end of file
+            return None
+
+    def transcribe(self, audio_data):
+        """
+        Transcribe audio data using Groq's Whisper API
+        """
+        try:
+            wav_bytes, digest = self.prepare(audio_data)
+        except Exception as e:
+            console.print(f"[ERROR] Transcription failed: {e}", style="bold red")
+            return None
+        return self.transcribe_wav(wav_bytes, digest)
@@ -312,7 +312,7 @@ export const App: React.FC = () => {
     setIsDarkMode(prev => !prev);
   };
 
-  const handleAudioData = async (audioData: Float32Array) => {
+  const handleAudioData = async (audioData: Float32Array, sampleRate: number) => {
     try {
       const response = await fetch(`${API_BASE}/audio`, {
         method: 'POST',
@@ -326,6 +326,8 @@ export const App: React.FC = () => {
         cache: 'no-cache',
         body: JSON.stringify({
           audio: Array.from(audioData),
+          sampleRate,
+          channels: 1,
         }),
       });
 
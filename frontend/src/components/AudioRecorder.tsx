@@ -3,13 +3,13 @@ import { throttle } from 'lodash';
 
 interface AudioRecorderProps {
   isListening: boolean;
-  onAudioData: (audioData: Float32Array) => void;
+  onAudioData: (audioData: Float32Array, sampleRate: number) => void;
 }
 
 const API_BASE = process.env.REACT_APP_API_URL || 'https://knowledgeos.onrender.com';
 const CHUNK_DURATION = 4000; // 4 seconds in milliseconds
 const OVERLAP_DURATION = 2000; // 2 seconds in milliseconds
-const SAMPLE_RATE = 16000;
+const DEFAULT_SAMPLE_RATE = 16000; // Fallback only; the server resamples from the native rate
 const SEND_INTERVAL = 1000; // Rate limit: send at most once per second
 
 export const AudioRecorder: React.FC<AudioRecorderProps> = ({ isListening, onAudioData }) => {
@@ -24,14 +24,13 @@ export const AudioRecorder: React.FC<AudioRecorderProps> = ({ isListening, onAud
   
   // Throttled send function to implement rate limiting
   const throttledSendAudio = useRef(
-    throttle(async (audioData: Float32Array) => {
+    throttle(async (audioData: Float32Array, sampleRate: number) => {
       try {
-        // Compress audio by downsampling if needed
-        const compressed = compressAudio(audioData);
-        onAudioData(compressed);
+        // Send the raw capture buffer; resampling happens server-side
+        onAudioData(audioData, sampleRate);
         console.log('Sent audio chunk:', {
-          originalSize: audioData.length,
-          compressedSize: compressed.length,
+          size: audioData.length,
+          sampleRate,
           timestamp: new Date().toISOString()
         });
       } catch (error) {
@@ -40,18 +39,6 @@ export const AudioRecorder: React.FC<AudioRecorderProps> = ({ isListening, onAud
     }, SEND_INTERVAL)
   ).current;
 
-  const compressAudio = (audioData: Float32Array): Float32Array => {
-    // Simple compression by downsampling to 16kHz if higher
-    const downsampleRatio = Math.floor(audioContextRef.current?.sampleRate ?? SAMPLE_RATE) / SAMPLE_RATE;
-    if (downsampleRatio <= 1) return audioData;
-
-    const compressed = new Float32Array(Math.floor(audioData.length / downsampleRatio));
-    for (let i = 0; i < compressed.length; i++) {
-      compressed[i] = audioData[i * Math.floor(downsampleRatio)];
-    }
-    return compressed;
-  };
-
   const processAudioChunk = (inputData: Float32Array) => {
     // Add new data to overlap buffer
     const newBuffer = new Float32Array(overlapBufferRef.current.length + inputData.length);
@@ -59,9 +46,10 @@ export const AudioRecorder: React.FC<AudioRecorderProps> = ({ isListening, onAud
     newBuffer.set(inputData, overlapBufferRef.current.length);
     overlapBufferRef.current = newBuffer;
 
-    // Check if we have enough data for a chunk
-    const samplesPerChunk = Math.floor((CHUNK_DURATION / 1000) * SAMPLE_RATE);
-    const overlapSamples = Math.floor((OVERLAP_DURATION / 1000) * SAMPLE_RATE);
+    // Check if we have enough data for a chunk at the capture rate
+    const sampleRate = audioContextRef.current?.sampleRate ?? DEFAULT_SAMPLE_RATE;
+    const samplesPerChunk = Math.floor((CHUNK_DURATION / 1000) * sampleRate);
+    const overlapSamples = Math.floor((OVERLAP_DURATION / 1000) * sampleRate);
 
     while (overlapBufferRef.current.length >= samplesPerChunk) {
       // Extract chunk
@@ -71,7 +59,7 @@ export const AudioRecorder: React.FC<AudioRecorderProps> = ({ isListening, onAud
       overlapBufferRef.current = overlapBufferRef.current.slice(samplesPerChunk - overlapSamples);
       
       // Send chunk
-      throttledSendAudio(chunk);
+      throttledSendAudio(chunk, sampleRate);
     }
   };
 
@@ -86,15 +74,14 @@ export const AudioRecorder: React.FC<AudioRecorderProps> = ({ isListening, onAud
             echoCancellation: true,
             noiseSuppression: true,
             autoGainControl: true,
-            channelCount: 1,
-            sampleRate: SAMPLE_RATE
+            channelCount: 1
           }
         });
 
         streamRef.current = stream;
         
-        // Initialize audio context and nodes
-        const audioContext = new AudioContext({ sampleRate: SAMPLE_RATE });
+        // Initialize audio context at the device's native rate
+        const audioContext = new AudioContext();
         audioContextRef.current = audioContext;
         
         const source = audioContext.createMediaStreamSource(stream);
@@ -117,7 +104,7 @@ export const AudioRecorder: React.FC<AudioRecorderProps> = ({ isListening, onAud
         };
 
         console.log('Audio recording initialized with settings:', {
-          sampleRate: SAMPLE_RATE,
+          sampleRate: audioContext.sampleRate,
           chunkDuration: CHUNK_DURATION,
           overlapDuration: OVERLAP_DURATION,
           rateLimit: SEND_INTERVAL